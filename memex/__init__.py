@@ -1,14 +1,10 @@
-import tomllib
-
-from memex.utils.path import resolve_pathish
+from importlib.metadata import PackageNotFoundError, version
 
 
 def get_version() -> str:
     try:
-        pyproject = resolve_pathish("pyproject.toml")
-        with open(pyproject, "rb") as f:
-            return tomllib.load(f)["project"]["version"]
-    except Exception:
+        return version("memex")
+    except PackageNotFoundError:
         return "0.0.0-dev"
 
 __version__ = get_version()
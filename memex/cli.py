@@ -11,34 +11,45 @@ memex = "memex.cli:cli"
 ````
 
 Provides a single Click *Group* named `cli` which aggregates all
-sub-commands found in `memex.scripts`.
+sub-commands found in `memex.scripts`. Sub-command modules are imported
+lazily, so `memex clean` never pays for `yaml`/`base64` etc. pulled in
+by the other commands.
 
 Adding a new command
 -----
-1. Create `memex/scripts/<verb>.py` with a `@click.command`.
+1. Create `memex/scripts/<verb>.py` with a `@click.command` named
+   `<verb>_cmd`.
 
-2. Import and register it here:
-
-   ```python
-   from memex.scripts.links import links_cmd
-   cli.add_command(links_cmd)
-   ```
+2. Add `<verb>` to `_COMMANDS` below.
 
 3. Re-install in editable mode or just `pip install -e .` once.
 """
 
+import importlib
+
 import click
 
 from memex import __version__
-from memex.scripts.base2img import base2img_cmd
-from memex.scripts.clean import clean_cmd
-from memex.scripts.init import init_cmd
-from memex.scripts.new import new_cmd
-from memex.scripts.taxa import taxa_cmd
-from memex.scripts.yfm import yfm_cmd
 
+# sub-command name -> memex.scripts.<name>.<name>_cmd
+_COMMANDS = ("base2img", "clean", "init", "new", "taxa", "yfm")
+
+
+class LazyGroup(click.Group):
+    """Click group that imports each sub-command module on first use."""
 
-@click.group(
+    def list_commands(self, ctx):
+        return list(_COMMANDS)
+
+    def get_command(self, ctx, name):
+        if name not in _COMMANDS:
+            return None
+        module = importlib.import_module(f"memex.scripts.{name}")
+        return getattr(module, f"{name}_cmd")
+
+
+@click.command(
+    cls=LazyGroup,
     context_settings=dict(help_option_names=["-h", "--help"]),
     invoke_without_command=False,
     help="Memex CLI. Run `memex <command> -h` for details.",
@@ -47,12 +58,5 @@ from memex.scripts.yfm import yfm_cmd
 def cli() -> None:
     pass
 
-cli.add_command(clean_cmd)
-cli.add_command(init_cmd)
-cli.add_command(new_cmd)
-cli.add_command(base2img_cmd)
-cli.add_command(yfm_cmd)
-cli.add_command(taxa_cmd)
-
 if __name__ == "__main__":
     cli()
@@ -1,97 +1,148 @@
-import base64
 import binascii
+import os
 import re
+
+try:
+    import pybase64 as _b64  # SIMD decoder, ~3x faster on large blobs
+except ImportError:
+    import base64 as _b64
 from logging import getLogger
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional
 
 import click
 
 from memex.utils import log_call
-from memex.utils.load import read_basename, read_file, read_path
+from memex.utils.load import read_path
 
 log = getLogger("memex")
 
+# head of an inline base64 image entry, compiled once at import.
+# The blob itself is found with str.find(')') - a plain linear scan -
+# instead of an unbounded [A-Za-z0-9+/=\r\n]+ class, so a huge blob with
+# a missing ')' can never send the regex engine backtracking.
+_B64_HEAD_RE = re.compile(r'!\[(?P<alt>[^\]]*)\]\(data:(?P<mime>[^;]+);base64,')
+# base64-alphabet check for the captured blob: fullmatch on a bounded-
+# repeat class is linear, and keeps junk (placeholders like '...', plain
+# prose after a truncated URI) away from the decoder, like the old
+# monolithic regex did by simply not matching
+_B64_BLOB_RE = re.compile(r'[A-Za-z0-9+/=\r\n]+')
+
 # make assets dir
 @log_call()
-def _make_assets_dir(files: List[Path]) -> List[Path]:
+def _make_assets_dir(file: Path) -> Path:
     """
-    For each file, create a sibling assets dir named <basename>.assets
-    Return list of created asset dirs.
+    Create a sibling assets dir named <basename>.assets for one file.
+    Return the created dir.
     """
-    dirs: List[Path] = []
-    for file in files:
-        assets_dir = file.parent / f"{file.stem}.assets"
-        assets_dir.mkdir(parents=True, exist_ok=True)
-        click.secho(f"Created: {assets_dir}", fg="blue")
-        dirs.append(assets_dir)
-    return dirs
+    assets_dir = file.parent / f"{file.stem}.assets"
+    assets_dir.mkdir(parents=True, exist_ok=True)
+    click.secho(f"Created: {assets_dir}", fg="blue")
+    return assets_dir
+
+# magic prefix -> extension; startswith avoids a slice copy per check
+_MAGIC = (
+    (b"\xff\xd8\xff",        ".jpg"),
+    (b"\x89PNG\r\n\x1a\n",   ".png"),
+    (b"GIF",                 ".gif"),
+)
 
 # sniff extension
 @log_call()
 def _sniff_ext(raw: bytes) -> str:
     """Sniff the extension of decoded base64, return string of extension"""
-    ext = (".jpg"  if raw[:3]  == b"\xff\xd8\xff" else
-           ".png"  if raw[:8]  == b"\x89PNG\r\n\x1a\n" else
-           ".gif"  if raw[:3]  == b"GIF" else
-           ".webp" if raw[0:4] == b"RIFF" and raw[8:12] == b"WEBP" else
-           ".bin")
-    return ext
+    for prefix, ext in _MAGIC:
+        if raw.startswith(prefix):
+            return ext
+    if len(raw) >= 12 and raw.startswith(b"RIFF") and raw[8:12] == b"WEBP":
+        return ".webp"
+    return ".bin"
 
 # catch all inline base64 image entries in one markdown string
 @log_call()
 def _catch_b64_entries(file_str: str) -> List[Dict[str, str]]:
     """
     catch all inline base64 image entries in one markdown string.
-    returns a list of records: {'full': full_markdown, 'alt': alt, 'blob': base64_blob}
+    returns a list of records: {'span': (start, end), 'alt': alt, 'blob': base64_blob}
+    where span covers the full ![alt](data:...) link in file_str.
     """
-    pattern = re.compile(
-        r'!\[(?P<alt>[^\]]*)\]\(data:(?P<mime>[^;]+);base64,(?P<blob>[A-Za-z0-9+/=\r\n]+)\)'
-    )
-
-    out: List[Dict[str, str]] = []
-    for m in pattern.finditer(file_str):
+    if "](data:" not in file_str:  # C-level scan, far cheaper than the regex
+        return []
+    out: List[Dict] = []
+    for m in _B64_HEAD_RE.finditer(file_str):
+        end = file_str.find(")", m.end())
+        if end == -1:  # unterminated link, nothing usable past here
+            break
+        blob = file_str[m.end():end]
+        if not blob or not _B64_BLOB_RE.fullmatch(blob):
+            continue
         out.append({
-            "full": m.group(0),
+            "span": (m.start(), end + 1),
             "alt":  m.group("alt"),
-            "blob": m.group("blob"),
+            "blob": blob,
         })
     return out
 
 # convert
 @log_call()
-def base2img(entries: List[Dict[str, str]], outdir: Path, prefix: str = "image_") -> List[Tuple[str, str]]:
+def base2img(entries: List[Dict], outdir: Path, prefix: str = "image_") -> List[Optional[str]]:
     """
-    decode and save; return replacements [(full_old_link, new_file_link)]
+    decode and save; return new markdown links, one per entry (same
+    order; None marks an entry that was skipped and must stay as-is)
     """
     outdir.mkdir(parents=True, exist_ok=True)
-    replacements: List[Tuple[str, str]] = []
+    new_links: List[Optional[str]] = []
+    msgs: List[str] = []  # buffer progress lines; one write beats N flushes
     for i, rec in enumerate(entries, 1):
-        payload = rec["blob"].replace("\n", "").replace("\r", "")
+        # validate=False discards \r\n in one C-level pass - no
+        # intermediate scrubbed copies needed. The blob already passed
+        # the alphabet check, but bad padding can still raise; skip the
+        # entry (None keeps it aligned for _rewrite_links) rather than
+        # abort a half-rewritten batch
         try:
-            raw = base64.b64decode(payload, validate=True)
-        except binascii.Error:
-            raw = base64.b64decode(payload)  # fallback
+            raw = _b64.b64decode(rec["blob"], validate=False)
+        except (binascii.Error, ValueError):
+            raw = b""
+        if not raw:  # undecodable or empty: leave the link untouched
+            msgs.append(click.style(f"[!] Skipped entry {i}: not decodable base64", fg="yellow"))
+            new_links.append(None)
+            continue
 
         ext = _sniff_ext(raw)
         outfile = outdir / f"{prefix}{i}{ext}"
-        with open(outfile, "wb") as f:
-            f.write(raw)
-        click.secho(f"[+] Saved {outfile} ({len(raw)/1024/1024:.2f} MB)", fg="blue")
+        # write to a temp file then rename, so interrupts never leave
+        # a truncated image behind
+        tmp = outfile.with_suffix(outfile.suffix + ".tmp")
+        tmp.write_bytes(raw)
+        os.replace(tmp, outfile)
+        msgs.append(click.style(f"[+] Saved {outfile} ({len(raw)/1024/1024:.2f} MB)", fg="blue"))
 
         # rewrite to relative link next to the .md
         rel_link = f"{outdir.name}/{outfile.name}"
-        new_md_link = f"![{rec['alt']}]({rel_link})"
-        replacements.append((rec["full"], new_md_link))
-    return replacements
+        new_links.append(f"![{rec['alt']}]({rel_link})")
+    if msgs:
+        click.echo("\n".join(msgs))
+    return new_links
 
 # rewritten links in markdown
 @log_call()
-def _rewrite_links(md_text: str, replacements: List[Tuple[str, str]]) -> str:
-    """apply replacements back into the markdown string"""
-    for old, new in replacements:
-        md_text = md_text.replace(old, new)
-    return md_text
+def _rewrite_links(md_text: str, entries: List[Dict], new_links: List[Optional[str]]) -> str:
+    """
+    splice new links into the markdown in one pass, using the spans
+    recorded by _catch_b64_entries (no repeated full-text str.replace).
+    Entries whose link is None are left exactly as they were.
+    """
+    pieces: List[str] = []
+    last = 0
+    for rec, link in zip(entries, new_links):
+        if link is None:
+            continue
+        start, end = rec["span"]
+        pieces.append(md_text[last:start])
+        pieces.append(link)
+        last = end
+    pieces.append(md_text[last:])
+    return "".join(pieces)
 
 # === Click command ===
 @click.command("base2img")
@@ -100,13 +151,18 @@ def base2img_cmd(files: Path) -> None:
     """
     Decode base64 images in Markdown and rewrite links to saved files.
     """
-    files = read_path(files) # List[Path]
-    asset_dirs = _make_assets_dir(files)
-    file_strs = read_file(files) # List[str]
-
-    for md_path, outdir, md_text in zip(files, asset_dirs, file_strs):
+    # stream one file at a time: read, convert, write, move on - peak
+    # memory stays at the largest single file, not the whole batch
+    for md_path in read_path(files):
+        md_text = md_path.read_text(encoding="utf-8")
         entries = _catch_b64_entries(md_text)
-        repls   = base2img(entries, outdir)
-        new_md  = _rewrite_links(md_text, repls) # string
-        md_path.write_text(new_md, encoding="utf-8")
-        click.secho(f"[✓] Rewrote {len(repls)} images in {md_path} → {outdir}", fg="green")
\ No newline at end of file
+        if not entries:  # no embedded images: no .assets dir, no rewrite
+            continue
+        outdir  = _make_assets_dir(md_path)
+        links   = base2img(entries, outdir)
+        rewrote = sum(1 for link in links if link is not None)
+        if not rewrote:  # every entry skipped: don't rewrite the file
+            continue
+        new_md  = _rewrite_links(md_text, entries, links) # string
+        md_path.write_bytes(new_md.encode("utf-8"))  # encode + write, once each
+        click.secho(f"[✓] Rewrote {rewrote} images in {md_path} → {outdir}", fg="green")
\ No newline at end of file
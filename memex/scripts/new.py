@@ -43,16 +43,17 @@ from memex.utils.yaml_tools import FlowList, MemexDumper
 
 log = getLogger("memex")
 
+# first path component after 'docs/' in a dir_rules pattern
+_DIR_RULE_RE = re.compile(r"docs/([^/]+)/")
+# leading 'YYYY-MM-DD-' date prefix on a slug
+_DATE_PREFIX_RE = re.compile(r"^\d{4}-\d{2}-\d{2}-")
+# separators accepted in multi-select input ("1,2" / "1 2" / mixes)
+_MULTISEL_SPLIT_RE = re.compile(r"[,\s]+")
+
 # === Small utils ===
 def _dedup_preserving_order(items: list[str]) -> List[str]:
-    """a de-dup util"""
-    seen = set()
-    out: List[str] = []
-    for x in items:
-        if x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
+    """a de-dup util (dict keeps insertion order, dedups in one C pass)"""
+    return list(dict.fromkeys(items))
 
 
 def _sanitize_slug(slug: str) -> str:
@@ -62,7 +63,7 @@ def _sanitize_slug(slug: str) -> str:
     s = slug.strip()
     if s.lower().endswith(".md"):
         s = s[:-3]
-    s = re.sub(r"^\d{4}-\d{2}-\d{2}-", "", s)
+    s = _DATE_PREFIX_RE.sub("", s)
     return s
  
 # === Folder / rules helpers ===
@@ -75,22 +76,26 @@ def _list_docs_subfolders(docs_dir: Path) -> List[str]:
     return sorted([p.name for p in docs_dir.iterdir() if p.is_dir()])
 
 
-def _infer_categories_for_folder(folder: str, dir_rules: dict) -> List[str]:
+def _build_folder_cats(dir_rules: dict) -> dict[str, List[str]]:
     """
     dir_rules keys look like 'docs/cheatsheets/**' -> categories: [...]
-    We match by checking if the pattern startswith 'docs/<folder>/'.
+    Flatten them into a {folder_name: [categories]} map so lookups are
+    O(1) instead of a startswith scan over every rule.
     """
-    # match `dir_rules` in `.memex.yml`, then make them as cats
-    want_prefix = f"docs/{folder}/"
-    inferred: List[str] = []
+    folder_cats: dict[str, List[str]] = {}
     for pattern, rule in (dir_rules or {}).items():
-        if isinstance(rule, dict) and "categories" in rule:
-            if str(pattern).startswith(want_prefix):
-                cats = rule.get("categories") or []
-                if isinstance(cats, list):
-                    inferred.extend(cats)
-    # de-dup preserving order
-    return _dedup_preserving_order(inferred)
+        if not isinstance(rule, dict):
+            continue
+        m = _DIR_RULE_RE.match(str(pattern))
+        cats = rule.get("categories")
+        if m and isinstance(cats, list):
+            folder_cats.setdefault(m.group(1), []).extend(cats)
+    return folder_cats
+
+
+def _infer_categories_for_folder(folder: str, folder_cats: dict[str, List[str]]) -> List[str]:
+    """Look up the categories mapped to a docs/ folder (deduped, ordered)."""
+    return _dedup_preserving_order(folder_cats.get(folder, []))
 
 
 # === Simple interactive prompts (numbered select) ===
@@ -143,7 +148,7 @@ def _cli_multiselect(title: str, options: List[str], prechecked: Optional[Iterab
         return list(pre) if pre else []
     
     sel: List[str] = []
-    for chunk in re.split(r"[,\s]+", raw.strip()):
+    for chunk in _MULTISEL_SPLIT_RE.split(raw.strip()):
         if not chunk:
             continue
         try:
@@ -216,7 +221,7 @@ def new_cmd(slug: str, interactive: bool, folder: Optional[str], cats: Optional[
     explicit_cats = safe_json_array(cats)
     explicit_tags = safe_json_array(tags)
 
-    inferred_cats = _infer_categories_for_folder(folder, dir_rules)
+    inferred_cats = _infer_categories_for_folder(folder, _build_folder_cats(dir_rules))
     avail_cats = list((taxonomy.get("categories") or {}).keys())
     avail_tags = list((taxonomy.get("tags") or {}).keys())
 
@@ -231,12 +236,13 @@ def new_cmd(slug: str, interactive: bool, folder: Optional[str], cats: Optional[
     final_tags = explicit_tags if explicit_tags is not None else picked_tags
 
     # 5) Build front matter
+    ts = now_str()  # one timestamp so date == last_update on a fresh file
     fm = {
          "layout": fm_defaults.get("layout", "post"),
          "title": title,
          "description": "",
-         "date": now_str(),
-         "last_update": now_str(),
+         "date": ts,
+         "last_update": ts,
         "categories": FlowList(final_categories or []),
         "tags": FlowList(final_tags or []),
          "img_path": fm_defaults.get("img_path", "/assets/img/posts/"),
@@ -258,10 +264,9 @@ def new_cmd(slug: str, interactive: bool, folder: Optional[str], cats: Optional[
             backup.write_text(out_path.read_text(encoding="utf-8"), encoding="utf-8")
             click.echo(f"{WARN} Backup written: {backup.relative_to(REPO_ROOT)}")
 
-    front = yaml.dump(fm, 
-                           Dumper=MemexDumper,
-                           sort_keys=False, 
-                           allow_unicode=True, 
+    front = yaml.dump(fm,
+                           Dumper=MemexDumper, # no-wrap + unicode baked in
+                           sort_keys=False,
                            default_flow_style=False # block mapping overall; flow only for FlowList
                            ).strip()
     
@@ -60,13 +60,31 @@ from memex.utils.yaml_tools import dump_no_wrap
 
 TAXONOMY_YML = resolve_pathish("docs/_data/taxonomy.yml")
 
+# parsed taxonomy cached per process; invalidated when the file changes
+_TAXO_CACHE: dict | None = None
+_TAXO_MTIME: int | None = None
+
+def _taxonomy_mtime() -> int | None:
+    try:
+        return TAXONOMY_YML.stat().st_mtime_ns
+    except OSError:
+        return None
+
 def _load_taxonomy() -> dict[str, dict[str, str]]:
-    """Load the taxonomy file fresh each time."""
-    return load_yaml(TAXONOMY_YML)
+    """Load the taxonomy file, reusing the parsed dict until it changes on disk."""
+    global _TAXO_CACHE, _TAXO_MTIME
+    mtime = _taxonomy_mtime()
+    if _TAXO_CACHE is None or mtime != _TAXO_MTIME:
+        _TAXO_CACHE = load_yaml(TAXONOMY_YML)
+        _TAXO_MTIME = mtime
+    return _TAXO_CACHE
 
 def _save_taxonomy(content: dict) -> None:
-    """Dump taxonomy content back to YAML file."""
+    """Dump taxonomy content back to YAML file (and refresh the cache)."""
+    global _TAXO_CACHE, _TAXO_MTIME
     TAXONOMY_YML.write_text(dump_no_wrap(content), encoding="utf-8")
+    _TAXO_CACHE = content
+    _TAXO_MTIME = _taxonomy_mtime()
 
 def _update_taxonomy(kind: str, action: str, values: Tuple[str, ...]) -> tuple[List[str], List[str]]:
     """
@@ -127,7 +145,7 @@ def list_cmd(kind: str) -> None:
     Show all current categories or tags.
     """
 
-    taxonomy_content = load_yaml(TAXONOMY_YML)
+    taxonomy_content = _load_taxonomy()
     section = "categories" if kind == "cats" else "tags"
     print(*[f"{k}: {v}" for k, v in taxonomy_content.get(section, {}).items()], sep="\n")
 
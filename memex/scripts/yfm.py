@@ -43,7 +43,7 @@ import yaml
 
 from memex.utils.date import now_str
 from memex.utils.symbols import CHECK, FAIL
-from memex.utils.yaml_tools import FlowList, MemexDumper
+from memex.utils.yaml_tools import FlowList, MemexDumper, MemexLoader
 
 
 @click.group("yfm")
@@ -80,7 +80,7 @@ def touch_cmd(paths: List[Path], do_last_update: bool) -> None:
             click.echo(f"{FAIL} {path}: malformed YAML front matter")
             continue
 
-        fm = yaml.safe_load(fm_text) or {}
+        fm = yaml.load(fm_text, Loader=MemexLoader) or {}
 
         # ensure flow style for categories & tags
         if "categories" in fm and isinstance(fm["categories"], list):
@@ -93,10 +93,9 @@ def touch_cmd(paths: List[Path], do_last_update: bool) -> None:
             fm["last_update"] = now_str()
 
         # Reconstruct file
-        new_front = yaml.dump(fm, 
-                               Dumper=MemexDumper,
-                               sort_keys=False, 
-                               allow_unicode=True, 
+        new_front = yaml.dump(fm,
+                               Dumper=MemexDumper, # no-wrap + unicode baked in
+                               sort_keys=False,
                                default_flow_style=False # block mapping overall; flow only for FlowList
                                ).strip()
         new_text = f"---\n{new_front}\n---{body}"
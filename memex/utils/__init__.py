@@ -1,5 +1,5 @@
-from memex.utils.load import read_lines, write_lines
+from memex.utils.load import iter_lines, read_lines, write_lines
 from memex.utils.logutils import log_call
 from memex.utils.path import REPO_ROOT, resolve_pathish
 
-__all__ = ["read_lines", "write_lines", "REPO_ROOT", "resolve_pathish", "log_call"]
+__all__ = ["read_lines", "iter_lines", "write_lines", "REPO_ROOT", "resolve_pathish", "log_call"]
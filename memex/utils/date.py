@@ -1,13 +1,33 @@
+import functools
 import os
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from logging import getLogger
 from zoneinfo import ZoneInfo
 
-from memex.utils import log_call
-
 log = getLogger("memex")
 
-@log_call()
+_NOW_FMT = "%Y-%m-%d %H:%M:%S %z"
+# tz key -> (expiry timestamp of next local midnight, ISO date string)
+_TODAY_CACHE: dict[str, tuple[float, str]] = {}
+
+@functools.lru_cache(maxsize=8)
+def _zoneinfo(name: str) -> ZoneInfo:
+    """Construct a ZoneInfo once per name (parsing tzdata is not cheap)."""
+    return ZoneInfo(name)
+
+# system tz resolved once at import - avoids re-statting /etc/localtime
+_SYS_TZ = datetime.now().astimezone().tzinfo
+
+def refresh_system_tz() -> datetime.tzinfo:
+    """
+    Re-read the system timezone. Only needed in long-running processes
+    that must notice a DST transition or a system tz change.
+    """
+    global _SYS_TZ
+    _SYS_TZ = datetime.now().astimezone().tzinfo
+    return _SYS_TZ
+
 def _choose_tz(tz_arg: str | None = None) -> datetime.tzinfo:
     """
     Selects the timezone to use, in this order:
@@ -23,30 +43,33 @@ def _choose_tz(tz_arg: str | None = None) -> datetime.tzinfo:
     """
     if tz_arg:                      # explicit flag wins
         log.debug("[_choose_tz] Use explicit timezone: %s", tz_arg)
-        return ZoneInfo(tz_arg)
+        return _zoneinfo(tz_arg)
     env = os.getenv("MEMEX_TZ")           # env var next
     if env:
         log.debug("[_choose_tz] Use environment timezone: %s", env)
-        return ZoneInfo(env)
-    # system zone - datetime grabs it automatically
-    sys_tz = datetime.now().astimezone().tzinfo
-    return sys_tz
+        return _zoneinfo(env)
+    # system zone, frozen at import (see refresh_system_tz)
+    return _SYS_TZ
 
-@log_call()
 def now(tz_arg: str | None = None) -> datetime:
     """Timezone-aware 'now' as datetime object."""
     tz = _choose_tz(tz_arg)
     return datetime.now(tz=tz)
 
-@log_call()
 def now_str(tz_arg: str | None = None) -> str:
     """Formatted 'now' as string 'YYYY-MM-DD HH:MM:SS +0000'."""
-    return now(tz_arg).strftime("%Y-%m-%d %H:%M:%S %z")
+    return now(tz_arg).strftime(_NOW_FMT)
 
-@log_call()
 def today_iso(tz_arg: str | None = None) -> str:
-    """Return YYYY-MM-DD of *today* in chosen tz."""
-    today = now(tz_arg).date().isoformat()
+    """Return YYYY-MM-DD of *today* in chosen tz (cached until local midnight)."""
+    key = tz_arg or os.getenv("MEMEX_TZ") or ""
+    hit = _TODAY_CACHE.get(key)
+    if hit and time.time() < hit[0]:
+        return hit[1]
+    dt = now(tz_arg)
+    today = dt.date().isoformat()
+    midnight = (dt + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    _TODAY_CACHE[key] = (midnight.timestamp(), today)
     return today
 
 if __name__ == "__main__":
@@ -8,30 +8,62 @@ Accepts either:
 
 from __future__ import annotations
 
-import json
+import mmap
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from logging import DEBUG, getLogger
 from pathlib import Path
-from typing import Iterable, List, Optional, Union
+from typing import Iterable, Iterator, List, Optional, Union
 
 import click
 import yaml
 
+try:
+    import orjson as _json  # ~3x faster parse, same loads() surface
+except ImportError:
+    import json as _json
+
 from memex.utils.path import resolve_pathish
+from memex.utils.yaml_tools import MemexLoader
 
 Pathish = Union[str, Path]
 
+log = getLogger("memex")
+
+# buffer for line-oriented reads; the 8 KiB default means far more read()
+# syscalls than necessary when ingesting a whole docs/ tree
+_READ_BUF = 128 * 1024
+
 def read_lines(pathish: Pathish, missing_ok: bool = True, encoding: str = "utf-8") -> List[str]:
     """
     Return list of lines. If file missing and missing_ok, return [].
     """
     p = resolve_pathish(pathish)
     try:
-        with p.open("r", encoding=encoding) as f:
-            return f.readlines()
+        with p.open("r", encoding=encoding, buffering=_READ_BUF) as f:
+            return list(f)
     except FileNotFoundError:
         if missing_ok:
             return []
         raise
 
+def iter_lines(pathish: Pathish, missing_ok: bool = True, encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Yield lines lazily - callers that stop early (e.g. front-matter scans
+    that break at the second '---') never pay for the document body.
+    """
+    p = resolve_pathish(pathish)
+    try:
+        f = p.open("r", encoding=encoding, buffering=_READ_BUF)
+    except FileNotFoundError:
+        if missing_ok:
+            return
+        raise
+    with f:
+        yield from f
+
 def write_lines(pathish: Pathish, lines: Iterable[str], encoding: str = "utf-8") -> None:
     """
     Write iterable of lines to file, creating parent dirs if needed.
@@ -43,26 +75,81 @@ def write_lines(pathish: Pathish, lines: Iterable[str], encoding: str = "utf-8")
             f.write(ln)
 
 # === YAML ===
-def load_yaml(path: Path) -> dict:
-    if not path.exists():
+# parsed YAML per path, keyed by st_mtime_ns; callers share the dict, so
+# treat the result as read-only unless you re-save the file afterwards
+_YAML_CACHE: dict = {}
+
+def _intern_tree(obj):
+    """
+    sys.intern every str in a parsed YAML tree (keys, values, list items).
+    Taxonomy vocabularies repeat the same small set of strings across
+    loads; interning dedups them and lets dict lookups hit the str
+    identity fast path.
+    """
+    if type(obj) is str:
+        return sys.intern(obj)
+    if type(obj) is dict:
+        return {_intern_tree(k): _intern_tree(v) for k, v in obj.items()}
+    if type(obj) is list:
+        return [_intern_tree(x) for x in obj]
+    return obj
+
+def load_yaml(path: Path, intern_strings: bool = True) -> dict:
+    try:
+        # no exists() pre-check: the stat we need anyway doubles as it
+        mtime = path.stat().st_mtime_ns
+    except OSError:
         return {}
+    hit = _YAML_CACHE.get(str(path))
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
     try:
-        return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        data = yaml.load(path.read_text(encoding="utf-8"), Loader=MemexLoader) or {}
     except Exception as e:
         click.secho(f"✘ Failed to parse {path}: {e}", fg="red")
         return {}
+    if intern_strings:
+        data = _intern_tree(data)
+    _YAML_CACHE[str(path)] = (mtime, data)
+    return data
+
+# front matter block at the very top of a .md file, matched on raw bytes
+_FM_RE = re.compile(rb"^---\r?\n(.*?)\r?\n---\r?\n", re.DOTALL)
+
+def read_front_matter(pathish: Pathish) -> tuple:
+    """
+    Parse only the YAML front matter of a markdown file.
+    Returns (front_matter_dict, body_offset_in_bytes); ({}, 0) when the
+    file has no front matter. The file is mmap'd and matched as bytes,
+    so the document body never gets read or decoded into Python.
+    """
+    p = resolve_pathish(pathish)
+    with p.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file cannot be mapped
+            return {}, 0
+        with mm:
+            m = _FM_RE.match(mm)
+            if not m:
+                return {}, 0
+            fm = yaml.load(mm[m.start(1):m.end(1)].decode("utf-8"), Loader=MemexLoader) or {}
+            return fm, m.end()
 
 # === JSON ===
+_BAD_JSON_ARRAY_MSG = 'Expected JSON array of strings, e.g. \'["🤖 tech","🐧 linux"]\''
+
 def safe_json_array(s: Optional[str]) -> Optional[List[str]]:
     if not s:
         return None
     try:
-        arr = json.loads(s)
-        if isinstance(arr, list) and all(isinstance(x, str) for x in arr):
-            return arr
+        arr = _json.loads(s)
     except Exception:
-        pass
-    raise click.BadParameter('Expected JSON array of strings, e.g. \'["🤖 tech","🐧 linux"]\'')
+        arr = None
+    # exact type checks compare type pointers in C - no MRO walk
+    if type(arr) is list and not any(type(x) is not str for x in arr):
+        return arr
+    raise click.BadParameter(_BAD_JSON_ARRAY_MSG)
 
 # === base2img ===
 def read_path(filepath: str) -> List[Path]:
@@ -70,27 +157,36 @@ def read_path(filepath: str) -> List[Path]:
     filepath = Path(filepath)
 
     if filepath.is_dir():
-        click.secho("Handle as folder", fg="cyan")
-        files: List[Path] = []
-        for file in filepath.iterdir():
-            click.secho(f"file={file}", fg="cyan", bold=True)
-            files.append(file)
+        # debug-only trace: styled echoes here leaked into normal CLI
+        # output and cost a write() per call
+        log.debug("[read_path] handle as folder: %s", filepath)
+        # DirEntry carries the type info from readdir, so no per-entry stat;
+        # also filters out subdirectories, which iterdir() used to let through
+        with os.scandir(filepath) as it:
+            files = [Path(e.path) for e in it if e.is_file(follow_symlinks=False)]
+        if log.isEnabledFor(DEBUG):
+            for file in files:
+                log.debug("[read_path] file=%s", file)
         return files
     elif filepath.is_file():
-        click.secho("Handle as file", fg="cyan")
+        log.debug("[read_path] handle as file: %s", filepath)
         return [filepath]
     else:
         click.secho("[!] Not found, or special type", fg="red", bold=True)
         return  []
     
+def _read_one(file: Path) -> str:
+    # one read() + one decode per file beats the buffered line machinery
+    return file.read_bytes().decode("utf-8")
+
 def read_file(files: List[Path]) -> list[str]:
     """Given list of file Paths, return their contents as strings."""
-    file_strs: List[str] = []
-    for file in files:
-        with open(file, "r", encoding="utf-8") as f:
-            content = f.read()
-            file_strs.append(content)
-    return file_strs
+    if len(files) < 4:  # pool setup costs more than it saves here
+        return [_read_one(file) for file in files]
+    # read() releases the GIL, so threads overlap the per-file syscall
+    # round trips; ex.map preserves input order
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as ex:
+        return list(ex.map(_read_one, files))
 
 def read_basename(files: List[Path]) -> List[str]:
     """Given list of file Paths, return list of their basename (without ext)"""
@@ -100,4 +196,4 @@ def read_basename(files: List[Path]) -> List[str]:
     #     basenames.append(file.stem)
     # return basenames
 
-__all__ = ["read_lines", "write_lines"]
+__all__ = ["read_lines", "iter_lines", "write_lines", "read_front_matter"]
@@ -1,14 +1,33 @@
+import functools
+import os
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
+_REPO_ROOT_STR = str(REPO_ROOT)  # already canonical - descendants need no re-resolve
 
 def path_to(*subdirs) -> Path:
     """
     Join subpaths to the repository root.
     Example: path_to('docs', 'git', '2025-07-18-git-privacy.md')
     """
+    return Path(os.path.join(_REPO_ROOT_STR, *subdirs))
+
+def path_to_resolved(*subdirs) -> Path:
+    """path_to() plus full symlink resolution, for the rare caller that needs it."""
     return REPO_ROOT.joinpath(*subdirs).resolve()
 
+@functools.lru_cache(maxsize=4096)
+def _resolve_str(s: str) -> Path:
+    """
+    Resolve one string to an absolute Path. normpath cleans up '..',
+    doubled and Windows-y separators without the lstat-per-component
+    walk that Path.resolve() does; repeat lookups hit the cache.
+    """
+    if os.path.isabs(s):
+        return Path(os.path.normpath(s))
+    rel = s.replace("\\", "/")
+    return Path(os.path.normpath(os.path.join(_REPO_ROOT_STR, rel)))
+
 def resolve_pathish(pathish) -> Path:
     """
     Accept a Path or string; return absolute Path.
@@ -19,15 +38,7 @@ def resolve_pathish(pathish) -> Path:
     if isinstance(pathish, Path):
         return pathish if pathish.is_absolute() else path_to(*pathish.parts)
 
-    s = str(pathish).strip()
-    # absolute?
-    p = Path(s)
-    if p.is_absolute():
-        return p.resolve()
-
-    parts = s.replace("\\", "/").split("/")
-    parts = [p for p in parts if p]  # drop empty from leading/trailing slash
-    return path_to(*parts)
+    return _resolve_str(str(pathish).strip())
 
 if __name__ == "__main__":
-    print(resolve_pathish("docs/_data/taxonomy.yml"))
\ No newline at end of file
+    print(resolve_pathish("docs/_data/taxonomy.yml"))
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-import re
-
 _REPLACE = {
     '‘': "'", '’': "'", '“': '"', '”': '"',
     '—': '-', ' ': ' ', ' ':' ', ' ': ' ', 
     '–': '-', '‑': '-',
 }
-_PATTERN = re.compile("|".join(map(re.escape, _REPLACE)))
+# every mapping is one codepoint -> one codepoint, so str.translate can
+# do the whole substitution in C; revisit if a multi-char mapping appears
+_TRANS = str.maketrans(_REPLACE)
 
 def clean_punctuation(text: str) -> str:
     """Return *text* with fancy Unicode punctuation normalized to ASCII/basic."""
-    return _PATTERN.sub(lambda m: _REPLACE[m.group()], text)
+    return text.translate(_TRANS)
 
 __all__ = ["clean_punctuation"]
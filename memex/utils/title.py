@@ -1,22 +1,25 @@
 import re
 from typing import List
 
+_SPLIT_RE = re.compile(r"[-_]")
 
-def title_from_filename(slug: str, acronym_map: dict[str, str], 
+
+def title_from_filename(slug: str, acronym_map: dict[str, str],
                         lil_words: list[str]) -> str:
     """
     - splits on hyphens/underscores
     - Title Case tokens
     - applies acronym_map & little words overrides (case-insensitive keys)
     """
-    slug_list = re.split("[-_]", slug.strip())
+    # lowercase the whole slug once; tokens come out already lowered
+    slug_list = _SPLIT_RE.split(slug.strip().lower())
+    lil = lil_words if isinstance(lil_words, frozenset) else frozenset(lil_words)
     process: List[str] = []
-    
-    for i, word in enumerate(slug_list):
-        low = word.lower()
+
+    for i, low in enumerate(slug_list):
         if low in acronym_map:
             process.append(acronym_map[low])
-        elif low in lil_words and i != 0: # don't lowercase first word
+        elif low in lil and i != 0: # don't lowercase first word
             process.append(low)
         else:
             process.append(low.capitalize())
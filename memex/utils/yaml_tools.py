@@ -2,19 +2,53 @@
 memex.utils.yaml_tools - YAML helpers for pretty front matter
 """
 
+import json
+from logging import getLogger
+
 import yaml
 
+log = getLogger("memex")
+
+# prefer the libyaml C loader; ~10x faster, same semantics
+MemexLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+if MemexLoader is yaml.SafeLoader:
+    log.debug("libyaml bindings unavailable; falling back to pure-Python YAML")
+# dumping stays pure-Python: the libyaml emitter escapes non-BMP chars
+# (all our emoji) to \U.... even with allow_unicode=True
+_BaseDumper = yaml.SafeDumper
+
+
+_SCALARS = (str, int, float, bool, type(None))
+
+def _is_flat(data: dict) -> bool:
+    """True when every value is a scalar or a list of scalars."""
+    for v in data.values():
+        if isinstance(v, list):
+            if not all(isinstance(x, _SCALARS) for x in v):
+                return False
+        elif not isinstance(v, _SCALARS):
+            return False
+    return True
+
 
 def dump_no_wrap(data: dict) -> str:
     """
     Dump YAML without automatic line-wrapping so long scalars stay intact.
     """
-    return yaml.dump(
-        data,
-        sort_keys=False,
-        width=10**9,
-        allow_unicode=True,
-    )
+    # fast path: JSON scalars are valid YAML, so a flat mapping can be
+    # emitted key-by-key without walking PyYAML's representer/emitter tree.
+    # json.dumps never wraps, quotes defensively, and keeps unicode intact.
+    if _is_flat(data):
+        lines = []
+        for k, v in data.items():
+            key = json.dumps(k, ensure_ascii=False)
+            if isinstance(v, list):
+                val = "[" + ", ".join(json.dumps(x, ensure_ascii=False) for x in v) + "]"
+            else:
+                val = json.dumps(v, ensure_ascii=False)
+            lines.append(f"{key}: {val}")
+        return "\n".join(lines) + "\n"
+    return yaml.dump(data, Dumper=MemexDumper, sort_keys=False)
 
 
 class FlowList(list):
@@ -24,14 +58,26 @@ class FlowList(list):
 def _represent_flow_seq(dumper, data):
     return dumper.represent_sequence("tag:yaml.org,2002:seq", data, flow_style=True)
 
-class MemexDumper(yaml.SafeDumper):
-    """Scoped dumper for memex so we don't mutate global PyYAML state."""
-    pass
+class MemexDumper(_BaseDumper):
+    """
+    Scoped dumper for memex so we don't mutate global PyYAML state.
+    No-wrap width and allow_unicode are baked in here so call sites
+    don't rebuild and re-parse the same kwargs on every dump.
+    """
+
+    def __init__(self, stream, **kwargs):
+        # yaml.dump forwards width=None/allow_unicode=None explicitly,
+        # so test for None rather than absence
+        if kwargs.get("width") is None:
+            kwargs["width"] = 10**9
+        if kwargs.get("allow_unicode") is None:
+            kwargs["allow_unicode"] = True
+        super().__init__(stream, **kwargs)
 
 # Register representers on our dumper (safe + scoped)
 MemexDumper.add_representer(FlowList, _represent_flow_seq)
 
-__all__ = ["FlowList", "MemexDumper"]
+__all__ = ["FlowList", "MemexDumper", "MemexLoader"]
 
 
 # === test ===